@@ -1,20 +1,135 @@
-from typing import Optional
+import asyncio
+import os
+import socket
+import sys
+import warnings
+from functools import cache, cached_property
+from typing import Any, Optional
 
 from loguru import logger
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from .commands import AsyncRedisModuleCommands
 from .pipeline import Pipeline
+from .tracing import TRACE_COMMANDS, trace_command
 
-__all__ = ["Redis"]
+__all__ = ["Redis", "install_uvloop"]
+
+# Detect dead connections after ~1 minute of silence instead of the OS default of hours.
+_KEEPALIVE_OPTIONS = {
+    option: value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if (option := getattr(socket, name, None)) is not None
+}
+
+# Commands that change the state of the connection they run on, they can't share a pipeline with other commands.
+_CONNECTION_STATE_COMMANDS = frozenset(("WATCH", "UNWATCH", "MULTI", "EXEC", "DISCARD"))
+
+
+def install_uvloop() -> bool:
+    """Sets uvloop's event loop policy when running on Linux with `FELPSBOT_USE_UVLOOP=1`.
+
+    Must be called before the event loop is created, e.g. before `asyncio.run`. Returns whether uvloop was installed,
+    raises `ImportError` if it was requested but `uvloop` is not installed.
+    """
+    if sys.platform != "linux" or os.environ.get("FELPSBOT_USE_UVLOOP") != "1":
+        return False
+
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+
+@cache
+def _warn_if_hiredis_missing() -> None:
+    # Cached so it is only logged once per process, not on every `connect`.
+    if not aioredis.connection.HIREDIS_AVAILABLE:
+        logger.warning("hiredis is not installed, falling back to the slower pure Python response parser")
 
 
 class Redis(AsyncRedisModuleCommands, aioredis.Redis):
     connection_pool: aioredis.ConnectionPool
 
+    def __init__(self, *args, auto_pipeline: bool = False, json_encoder=None, json_decoder=None, **kwargs):
+        """Creates a Redis client, accepts the same arguments as `redis.asyncio.Redis`.
+
+        With `auto_pipeline`, commands issued in the same event loop iteration are sent together in a single
+        non-transactional pipeline, see `execute_command_batched`.
+
+        `json_encoder`/`json_decoder` are used by the `json` module, e.g. `OrjsonEncoder()`/`OrjsonDecoder()` from
+        `felpsbot_redis.async_json.encoders` to opt in to orjson.
+        """
+        super().__init__(*args, **kwargs)
+        self._json_encoder = json_encoder
+        self._json_decoder = json_decoder
+        self._batch: list[tuple[tuple, dict, asyncio.Future]] = []
+        self._batch_tasks: set[asyncio.Task] = set()
+        if auto_pipeline:
+            # Set on the instance so modules that bind `execute_command` on creation (e.g. json) also batch.
+            # It replaces the traced `execute_command`, `execute_command_batched` is traced on its own.
+            self.execute_command = self.execute_command_batched
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        single_connection_client: bool = False,
+        auto_close_connection_pool: Optional[bool] = None,
+        *,
+        blocking_pool: bool = False,
+        timeout: Optional[float] = 5,
+        auto_pipeline: bool = False,
+        json_encoder=None,
+        json_decoder=None,
+        **kwargs,
+    ) -> "Redis":
+        """Creates a Redis client from a URL, see `redis.asyncio.Redis.from_url`.
+
+        Connections use TCP keepalive and are health checked every 30 seconds unless overridden in `kwargs`, which are
+        passed to the connection pool along with the URL options (e.g. `max_connections`).
+
+        With `blocking_pool`, a `redis.asyncio.BlockingConnectionPool` is used: once `max_connections` are in use,
+        commands wait up to `timeout` seconds for a connection to be released instead of raising. Note that in
+        redis-py 5.0.1 that pool leaks a connection slot every time connecting fails.
+        """
+        kwargs.setdefault("socket_keepalive", True)
+        kwargs.setdefault("socket_keepalive_options", _KEEPALIVE_OPTIONS)
+        kwargs.setdefault("health_check_interval", 30)
+        if blocking_pool:
+            connection_pool = aioredis.BlockingConnectionPool.from_url(url, timeout=timeout, **kwargs)
+        else:
+            connection_pool = aioredis.ConnectionPool.from_url(url, **kwargs)
+
+        client = cls(
+            connection_pool=connection_pool,
+            single_connection_client=single_connection_client,
+            auto_pipeline=auto_pipeline,
+            json_encoder=json_encoder,
+            json_decoder=json_decoder,
+        )
+        if auto_close_connection_pool is not None:
+            warnings.warn(
+                DeprecationWarning(
+                    '"auto_close_connection_pool" is deprecated since version 5.0.0. '
+                    "Please create a ConnectionPool explicitly and provide to the Redis() constructor instead."
+                )
+            )
+        else:
+            # The pool was created here, so the client owns it and closes it on `aclose`.
+            auto_close_connection_pool = True
+        client.auto_close_connection_pool = auto_close_connection_pool
+        return client
+
     async def connect(self) -> None:
-        """Opens a connection with Redis, raises `redis.exceptions.RedisConnectionError` if not able to connect."""
-        logger.info(f"Connecting to Redis")
+        """Opens a connection with Redis, raises `redis.exceptions.RedisConnectionError` if not able to connect.
+
+        The connection runs on the current event loop, to use uvloop call `install_uvloop` before creating it.
+        """
+        logger.info("Connecting to Redis")
+        _warn_if_hiredis_missing()
         if await self.ping():
             logger.info("Connected to Redis")
 
@@ -23,25 +138,77 @@ class Redis(AsyncRedisModuleCommands, aioredis.Redis):
         logger.info("Disconnecting from Redis")
         await self.aclose()
 
-    async def execute_command(self, *args, **options):
-        command_name = args[0]
-        logger.debug(f"Executing command {command_name} with args {args[1:]}")
-        resp = await super().execute_command(*args, **options)
-        logger.debug(f"Response from command {command_name} with args {args[1:]}: {resp!r}")
-        return resp
+    if TRACE_COMMANDS:
+
+        @trace_command
+        async def execute_command(self, *args, **options):
+            return await super().execute_command(*args, **options)
+
+    async def execute_command_batched(self, *args, **options) -> Any:
+        """Executes a command together with every other command issued in the same event loop iteration.
+
+        The commands are flushed in a single non-transactional pipeline, so they share one write and one connection.
+        Blocking commands (e.g. `BLPOP`) delay the whole batch and should not be issued through this method.
+        Commands that change the connection's state (e.g. `WATCH`) are executed on their own, like without batching.
+        """
+        if args[0] in _CONNECTION_STATE_COMMANDS:
+            return await super().execute_command(*args, **options)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._batch:
+            loop.call_soon(self._flush_batch)
+        self._batch.append((args, options, future))
+        return await future
+
+    if TRACE_COMMANDS:
+        execute_command_batched = trace_command(execute_command_batched)
+
+    def _flush_batch(self) -> None:
+        batch, self._batch = self._batch, []
+        task = asyncio.create_task(self._execute_batch(batch))
+        # Keep a reference until it finishes, the event loop only holds weak references to tasks.
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _execute_batch(self, batch: list[tuple[tuple, dict, asyncio.Future]]) -> None:
+        # A plain pipeline, the logging one would log every flush.
+        pipe = aioredis.client.Pipeline(self.connection_pool, self.response_callbacks, False, None)
+        for args, options, _ in batch:
+            # Queue directly, `execute_command` runs some commands immediately instead of queueing them.
+            pipe.pipeline_execute_command(*args, **options)
+
+        try:
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+
+        if len(results) != len(batch):
+            error = RedisError(f"Pipeline returned {len(results)} results for {len(batch)} commands")
+            results = [error] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
     def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> "Pipeline":
-        logger.debug(f"Creating pipeline with {transaction=}")
         return Pipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
 
-    @property
+    @cached_property
     def json(self):
-        if not hasattr(self, "__json_module__"):
-            self.__json_module__ = super().json()
-        return self.__json_module__
+        return super().json(encoder=self._json_encoder, decoder=self._json_decoder)
 
-    @property
+    @cached_property
     def ft(self):
-        if not hasattr(self, "__ft_module__"):
-            self.__ft_module__ = super().ft()
-        return self.__ft_module__
+        return super().ft()
@@ -1,13 +1,52 @@
+from functools import partial
+from json import JSONEncoder
+from json.encoder import encode_basestring_ascii
+from math import isfinite
+
 import redis.asyncio.client
 import redis.commands.json
 
 from ..pipeline import Pipeline
-from .commands import AsyncJSONCommands
+from .commands import SET_WITH_TTL_SCRIPT, AsyncJSONCommands
+from .encoders import DEFAULT_DECODER, DEFAULT_ENCODER, OrjsonEncoder
 
 __all__ = ["AsyncJSON", "AsyncJSONCommands"]
 
 
 class AsyncJSON(AsyncJSONCommands, redis.commands.json.JSON):
+    def __init__(self, client, version=None, decoder=DEFAULT_DECODER, encoder=DEFAULT_ENCODER):
+        super().__init__(client, version=version, decoder=decoder, encoder=encoder)
+        if type(encoder) is OrjsonEncoder:
+            # orjson handles scalars just as fast, so call it directly instead of going through `_encode`.
+            self._encode = encoder.encode
+        # Scalars can only skip the encoder when it is a stock one, custom encoders may change their output.
+        self._encode_scalars = type(encoder) is JSONEncoder and encoder.ensure_ascii
+        self._set_with_ttl_script = client.register_script(SET_WITH_TTL_SCRIPT)
+        # The client type doesn't change, so pick the pipeline implementation once.
+        self._pipeline_impl = super().pipeline if isinstance(client, redis.RedisCluster) else self._async_pipeline
+
+    def _encode(self, obj):
+        """Get the encoder, bypassing it for scalars when the default encoder is used."""
+        if self._encode_scalars:
+            obj_type = type(obj)
+            if obj_type is str:
+                return encode_basestring_ascii(obj)
+            elif obj_type is bool:
+                return "true" if obj else "false"
+            elif obj_type is int:
+                return int.__repr__(obj)
+            elif obj_type is float:
+                if isfinite(obj):
+                    return float.__repr__(obj)
+            elif obj is None:
+                return "null"
+        return self.__encoder__.encode(obj)
+
+    async def _set_with_ttl(self, keys, args):
+        resp = await self._set_with_ttl_script(keys=keys, args=args)
+        # Same result as a plain `JSON.SET`, which goes through the module's response callback.
+        return self._MODULE_CALLBACKS["JSON.SET"](resp)
+
     def pipeline(self, transaction=True, shard_hint=None):
         """Creates an async pipeline for the JSON module, that can be used for executing
         JSON commands, as well as classic core commands.
@@ -21,18 +60,19 @@ class AsyncJSON(AsyncJSONCommands, redis.commands.json.JSON):
         pipe.get('notakey')
         await pipe.execute()
         """
-        if isinstance(self.client, redis.RedisCluster):
-            return super().pipeline(transaction, shard_hint)
-        else:
-            p = AsyncPipeline(
-                connection_pool=self.client.connection_pool,
-                response_callbacks=self._MODULE_CALLBACKS,  # type: ignore
-                transaction=transaction,
-                shard_hint=shard_hint,
-            )
+        return self._pipeline_impl(transaction, shard_hint)
 
+    def _async_pipeline(self, transaction, shard_hint):
+        p = AsyncPipeline(
+            connection_pool=self.client.connection_pool,
+            response_callbacks=self._MODULE_CALLBACKS,  # type: ignore
+            transaction=transaction,
+            shard_hint=shard_hint,
+        )
         p._encode = self._encode
         p._decode = self._decode
+        p.__decoder__ = self.__decoder__
+        p._set_with_ttl = partial(self._set_with_ttl_script, client=p)
         return p
 
 
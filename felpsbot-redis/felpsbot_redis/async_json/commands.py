@@ -1,10 +1,13 @@
+import asyncio
 import json
 import os
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -17,6 +20,42 @@ from redis.commands.json.decoders import decode_dict_keys
 from redis.commands.json.path import Path
 from redis.exceptions import DataError
 
+# `Path.root_path()` is a constant, resolve it once instead of on every call.
+_ROOT_PATH = Path.root_path()
+
+# Sets a JSON value and its expiration atomically in a single round-trip.
+# KEYS[1] is the key, ARGV[1] the ttl in seconds and the remaining ARGV are passed to JSON.SET.
+SET_WITH_TTL_SCRIPT = """
+local resp = redis.call('JSON.SET', KEYS[1], unpack(ARGV, 2))
+if resp then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return resp
+"""
+
+# Number of files read and sent per round-trip by `set_path`.
+_SET_PATH_CHUNK_SIZE = 128
+
+
+def _load_json_file(file_name: str, decoder: Any) -> JsonType:
+    with open(file_name, "r") as fp:
+        return decoder.decode(fp.read())
+
+
+def _iter_files(folder: str) -> Iterator[str]:
+    """Recursively yield the path of every file under ``folder``, skipping unreadable folders like `os.walk`."""
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                yield entry.path
+            elif not entry.is_symlink():
+                yield from _iter_files(entry.path)
+
 
 class AsyncJSONCommands:
     """Asynchronous JSON commands for Redis."""
@@ -28,18 +67,18 @@ class AsyncJSONCommands:
         execute_command = cast(Callable[..., Any], None)
         _encode = cast(Callable[..., Any], None)
         _decode = cast(Callable[..., Any], None)
+        __decoder__ = cast(Any, None)
+        _set_with_ttl = cast(Callable[..., Any], None)
 
     async def arrappend(
-        self, name: str, path: Optional[str] = Path.root_path(), *args: List[JsonType]
+        self, name: str, path: Optional[str] = _ROOT_PATH, *args: List[JsonType]
     ) -> List[Union[int, None]]:
         """Asynchronously append the objects `args` to the array under the
         `path` in key `name`.
 
         For more information see `JSON.ARRAPPEND <https://redis.io/commands/json.arrappend>`_.
         """
-        pieces = [name, str(path)]
-        for o in args:
-            pieces.append(self._encode(o))
+        pieces = [name, str(path), *map(self._encode, args)]
         return await self.execute_command("JSON.ARRAPPEND", *pieces)
 
     async def arrindex(
@@ -67,12 +106,10 @@ class AsyncJSONCommands:
 
         For more information see `JSON.ARRINSERT <https://redis.io/commands/json.arrinsert>`_.
         """
-        pieces = [name, str(path), index]
-        for o in args:
-            pieces.append(self._encode(o))
+        pieces = [name, str(path), index, *map(self._encode, args)]
         return await self.execute_command("JSON.ARRINSERT", *pieces)
 
-    async def arrlen(self, name: str, path: Optional[str] = Path.root_path()) -> List[Union[int, None]]:
+    async def arrlen(self, name: str, path: Optional[str] = _ROOT_PATH) -> List[Union[int, None]]:
         """Asynchronously return the length of the array JSON value under `path`
         at key `name`.
 
@@ -81,7 +118,7 @@ class AsyncJSONCommands:
         return await self.execute_command("JSON.ARRLEN", name, str(path))
 
     async def arrpop(
-        self, name: str, path: Optional[str] = Path.root_path(), index: Optional[int] = -1
+        self, name: str, path: Optional[str] = _ROOT_PATH, index: Optional[int] = -1
     ) -> List[Union[str, None]]:
         """Asynchronously pop the element at `index` in the array JSON value under
         `path` at key `name`.
@@ -98,21 +135,21 @@ class AsyncJSONCommands:
         """
         return await self.execute_command("JSON.ARRTRIM", name, str(path), start, stop)
 
-    async def type(self, name: str, path: Optional[str] = Path.root_path()) -> List[str]:
+    async def type(self, name: str, path: Optional[str] = _ROOT_PATH) -> List[str]:
         """Asynchronously get the type of the JSON value under `path` from key `name`.
 
         For more information see `JSON.TYPE <https://redis.io/commands/json.type>`_.
         """
         return await self.execute_command("JSON.TYPE", name, str(path))
 
-    async def resp(self, name: str, path: Optional[str] = Path.root_path()) -> List:
+    async def resp(self, name: str, path: Optional[str] = _ROOT_PATH) -> List:
         """Asynchronously return the JSON value under `path` at key `name`.
 
         For more information see `JSON.RESP <https://redis.io/commands/json.resp>`_.
         """
         return await self.execute_command("JSON.RESP", name, str(path))
 
-    async def objkeys(self, name: str, path: Optional[str] = Path.root_path()) -> List[Union[List[str], None]]:
+    async def objkeys(self, name: str, path: Optional[str] = _ROOT_PATH) -> List[Union[List[str], None]]:
         """Asynchronously return the key names in the dictionary JSON value under `path` at
         key `name`.
 
@@ -120,7 +157,7 @@ class AsyncJSONCommands:
         """
         return await self.execute_command("JSON.OBJKEYS", name, str(path))
 
-    async def objlen(self, name: str, path: Optional[str] = Path.root_path()) -> int:
+    async def objlen(self, name: str, path: Optional[str] = _ROOT_PATH) -> int:
         """Asynchronously return the length of the dictionary JSON value under `path` at key
         `name`.
 
@@ -138,7 +175,7 @@ class AsyncJSONCommands:
 
     # The `nummultby` method is deprecated, so it's omitted in this async version.
 
-    async def clear(self, name: str, path: Optional[str] = Path.root_path()) -> int:
+    async def clear(self, name: str, path: Optional[str] = _ROOT_PATH) -> int:
         """Asynchronously empty arrays and objects (to have zero slots/keys without deleting the
         array/object). Return the count of cleared paths (ignoring non-array and non-objects
         paths).
@@ -147,7 +184,7 @@ class AsyncJSONCommands:
         """
         return await self.execute_command("JSON.CLEAR", name, str(path))
 
-    async def delete(self, key: str, path: Optional[str] = Path.root_path()) -> int:
+    async def delete(self, key: str, path: Optional[str] = _ROOT_PATH) -> int:
         """Asynchronously delete the JSON value stored at key `key` under `path`.
 
         For more information see `JSON.DEL <https://redis.io/commands/json.del>`_.
@@ -169,7 +206,7 @@ class AsyncJSONCommands:
             pieces.append("noescape")
 
         if len(args) == 0:
-            pieces.append(Path.root_path())
+            pieces.append(_ROOT_PATH)
         else:
             for p in args:
                 pieces.append(str(p))
@@ -205,6 +242,11 @@ class AsyncJSONCommands:
 
         ``nx`` if set to True, set ``value`` only if it does not exist.
         ``xx`` if set to True, set ``value`` only if it exists.
+        ``ttl`` if set, the key expires after ``ttl`` seconds. The value and the expiration
+        are set atomically, and the expiration is only applied if the value was set. In a
+        pipeline, a set with ``ttl`` runs as a Lua script and its result is the raw reply
+        (``b"OK"``, or ``"OK"`` with ``decode_responses``, and ``None`` if the value was not
+        set) instead of ``True``.
         ``decode_keys`` If set to True, the keys of ``obj`` will be decoded with utf-8.
 
         For more information see `JSON.SET <https://redis.io/commands/json.set>`_.
@@ -222,10 +264,7 @@ class AsyncJSONCommands:
             pieces.append("XX")
 
         if ttl is not None and ttl > 0:
-            pipe = self.pipeline()
-            pipe.execute_command("JSON.SET", *pieces)
-            pipe.expire(name, ttl)
-            return await pipe.execute()
+            return await self._set_with_ttl(keys=[name], args=[ttl, *pieces[1:]])
         else:
             return await self.execute_command("JSON.SET", *pieces)
 
@@ -238,9 +277,8 @@ class AsyncJSONCommands:
 
         For more information see `JSON.MSET <https://redis.io/commands/json.mset>`_.
         """
-        pieces = []
-        for triplet in triplets:
-            pieces.extend([triplet[0], str(triplet[1]), self._encode(triplet[2])])
+        encode = self._encode
+        pieces = [piece for key, path, obj in triplets for piece in (key, str(path), encode(obj))]
 
         return await self.execute_command("JSON.MSET", *pieces)
 
@@ -270,13 +308,12 @@ class AsyncJSONCommands:
     ) -> Optional[str]:
         """
         Asynchronously set the JSON value at key ``name`` under the ``path`` to the content
-        of the json file ``file_name``.
+        of the json file ``file_name``. The file is read and parsed in a worker thread,
+        with the same decoder used for replies.
 
         For more information see `JSON.SET <https://redis.io/commands/json.set>`_.
         """
-        with open(file_name, "r") as fp:
-            file_content = json.loads(fp.read())
-
+        file_content = await asyncio.to_thread(_load_json_file, file_name, self.__decoder__)
         return await self.set(name, path, file_content, nx=nx, xx=xx, decode_keys=decode_keys)
 
     async def set_path(
@@ -291,25 +328,43 @@ class AsyncJSONCommands:
         Asynchronously iterate over ``root_folder`` and set each JSON file to a value
         under ``json_path`` with the file name as the key.
 
+        The files are read concurrently and sent in chunks, so only one chunk of files is held
+        in memory at a time. Files that are not valid JSON are reported as ``False`` in the
+        result and not set.
+
         For more information see `JSON.SET <https://redis.io/commands/json.set>`_.
         """
         set_files_result = {}
-        for root, dirs, files in os.walk(root_folder):
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    file_name = file_path.rsplit(".")[0]
-                    await self.set_file(
-                        file_name,
-                        json_path,
-                        file_path,
-                        nx=nx,
-                        xx=xx,
-                        decode_keys=decode_keys,
-                    )
-                    set_files_result[file_path] = True
-                except json.JSONDecodeError:
+        files = _iter_files(root_folder)
+        while file_paths := list(islice(files, _SET_PATH_CHUNK_SIZE)):
+            file_contents = await asyncio.gather(
+                *(asyncio.to_thread(_load_json_file, file_path, self.__decoder__) for file_path in file_paths),
+                return_exceptions=True,
+            )
+
+            triplets = []
+            for file_path, file_content in zip(file_paths, file_contents):
+                if isinstance(file_content, json.JSONDecodeError):
                     set_files_result[file_path] = False
+                    continue
+                elif isinstance(file_content, BaseException):
+                    raise file_content
+
+                if decode_keys:
+                    file_content = decode_dict_keys(file_content)
+                triplets.append((file_path.rsplit(".")[0], json_path, file_content))
+                set_files_result[file_path] = True
+
+            if not triplets:
+                continue
+            elif nx or xx:
+                # JSON.MSET doesn't support conditional sets, so fall back to a pipeline of JSON.SET.
+                pipe = self.pipeline(transaction=False)
+                for file_name, path, file_content in triplets:
+                    await pipe.set(file_name, path, file_content, nx=nx, xx=xx)
+                await pipe.execute()
+            else:
+                await self.mset(triplets)
 
         return set_files_result
 
@@ -324,7 +379,7 @@ class AsyncJSONCommands:
             pieces.append(str(path))
         return await self.execute_command("JSON.STRLEN", *pieces)
 
-    async def toggle(self, name: str, path: Optional[str] = Path.root_path()) -> Union[bool, List[Optional[int]]]:
+    async def toggle(self, name: str, path: Optional[str] = _ROOT_PATH) -> Union[bool, List[Optional[int]]]:
         """Asynchronously toggle the boolean value under ``path`` at key ``name``,
         returning the new value.
 
@@ -333,7 +388,7 @@ class AsyncJSONCommands:
         return await self.execute_command("JSON.TOGGLE", name, str(path))
 
     async def strappend(
-        self, name: str, value: str, path: Optional[str] = Path.root_path()
+        self, name: str, value: str, path: Optional[str] = _ROOT_PATH
     ) -> Union[int, List[Optional[int]]]:
         """Asynchronously append to the string JSON value.
 
@@ -343,7 +398,7 @@ class AsyncJSONCommands:
         return await self.execute_command("JSON.STRAPPEND", *pieces)
 
     async def debug(
-        self, subcommand: str, key: Optional[str] = None, path: Optional[str] = Path.root_path()
+        self, subcommand: str, key: Optional[str] = None, path: Optional[str] = _ROOT_PATH
     ) -> Union[int, List[str]]:
         """Asynchronously return the memory usage in bytes of a value under ``path`` from
         key ``name``.
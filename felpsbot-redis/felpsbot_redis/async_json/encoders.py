@@ -0,0 +1,72 @@
+import re
+from json import JSONDecoder, JSONEncoder
+from math import isfinite
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared by every `AsyncJSON` instance that doesn't provide its own encoder/decoder.
+DEFAULT_ENCODER = JSONEncoder()
+DEFAULT_DECODER = JSONDecoder()
+
+# orjson parses integers outside of the 64-bit range as floats, replies with 19+ digit runs are
+# decoded with the stdlib instead. Digits inside strings can match too, which only costs speed.
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not isfinite(obj)
+    elif isinstance(obj, dict):
+        return any(_has_non_finite_float(k) or _has_non_finite_float(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(o) for o in obj)
+    return False
+
+
+class OrjsonEncoder:
+    """`json.JSONEncoder` compatible encoder backed by orjson, raises `ImportError` if orjson is not installed.
+
+    Values orjson encodes differently from `json.JSONEncoder` (integers outside of the 64-bit range and
+    non-finite floats, which orjson writes as `null`) are encoded with `DEFAULT_ENCODER` instead.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonEncoder requires orjson to be installed")
+
+    def encode(self, obj: Any) -> bytes | str:
+        try:
+            encoded = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return DEFAULT_ENCODER.encode(obj)
+        if b"null" in encoded and _has_non_finite_float(obj):
+            return DEFAULT_ENCODER.encode(obj)
+        return encoded
+
+
+class OrjsonDecoder:
+    """`json.JSONDecoder` compatible decoder backed by orjson, raises `ImportError` if orjson is not installed.
+
+    Documents orjson can't decode the same way as `json.JSONDecoder` (integers outside of the 64-bit range,
+    `NaN`/`Infinity`) are decoded with `DEFAULT_DECODER` instead.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonDecoder requires orjson to be installed")
+
+    def decode(self, s: str | bytes) -> Any:
+        long_digits = _LONG_DIGITS_BYTES if isinstance(s, (bytes, bytearray)) else _LONG_DIGITS_STR
+        if long_digits.search(s) is None:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        if isinstance(s, (bytes, bytearray)):
+            s = s.decode()
+        return DEFAULT_DECODER.decode(s)
@@ -1,12 +1,19 @@
-from json import JSONDecoder, JSONEncoder
-
 import redis.commands.redismodules
 
 from .async_json import AsyncJSON
+from .async_json.encoders import DEFAULT_DECODER, DEFAULT_ENCODER
 
 
 class AsyncRedisModuleCommands(redis.commands.redismodules.AsyncRedisModuleCommands):
-    def json(self, encoder=JSONEncoder(), decoder=JSONDecoder()):
-        """Access the json namespace, providing support for redis json."""
+    def json(self, encoder=None, decoder=None):
+        """Access the json namespace, providing support for redis json.
+
+        Uses shared `json.JSONEncoder`/`json.JSONDecoder` instances unless an `encoder`/`decoder` is given, see
+        `felpsbot_redis.async_json.encoders` for orjson backed ones.
+        """
 
-        return AsyncJSON(client=self, encoder=encoder, decoder=decoder)
+        return AsyncJSON(
+            client=self,
+            encoder=DEFAULT_ENCODER if encoder is None else encoder,
+            decoder=DEFAULT_DECODER if decoder is None else decoder,
+        )
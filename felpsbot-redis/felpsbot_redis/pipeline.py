@@ -5,6 +5,8 @@ from loguru import logger
 from redis.asyncio.client import ResponseCallbackT
 from redis.asyncio.connection import ConnectionPool
 
+from .tracing import TRACE_COMMANDS
+
 
 class Pipeline(redis.asyncio.client.Pipeline):
     def __init__(
@@ -14,16 +16,20 @@ class Pipeline(redis.asyncio.client.Pipeline):
         transaction: bool,
         shard_hint: str | None,
     ):
-        logger.debug(f"Creating pipeline with {transaction=}")
+        logger.debug("Creating pipeline with transaction={}", transaction)
         super().__init__(connection_pool, response_callbacks, transaction, shard_hint)
 
     async def execute(self, raise_on_error=True):
-        logger.debug(f"Executing pipeline")
+        logger.debug("Executing pipeline")
         resp = await super().execute(raise_on_error=raise_on_error)
-        logger.debug(f"Response from pipeline: {resp!r}")
+        logger.debug("Response from pipeline: {!r}", resp)
         return resp
 
-    def execute_command(self, *args, **options):
-        command_name = args[0]
-        logger.debug(f"Adding command {command_name} to pipeline with args {args[1:]}")
-        return super().execute_command(*args, **options)
+    if TRACE_COMMANDS:
+
+        def execute_command(self, *args, **options):
+            command_name = args[0]
+            logger.opt(lazy=True).debug(
+                "Adding command {} to pipeline with args {}", lambda: command_name, lambda: args[1:]
+            )
+            return super().execute_command(*args, **options)
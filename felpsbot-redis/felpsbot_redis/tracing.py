@@ -0,0 +1,25 @@
+import os
+from functools import wraps
+
+from loguru import logger
+
+# Per-command tracing is only wired in when `FELPSBOT_REDIS_TRACE=1`, so the default
+# path calls straight into redis-py without an extra frame and log formatting.
+TRACE_COMMANDS = os.environ.get("FELPSBOT_REDIS_TRACE") == "1"
+
+
+def trace_command(execute_command):
+    """Wraps an async `execute_command` like method to log each command and its response."""
+
+    @wraps(execute_command)
+    async def wrapper(self, *args, **options):
+        command_name = args[0]
+        # Lazy, so the args slice is only built when the record is actually emitted.
+        logger.opt(lazy=True).debug("Executing command {} with args {}", lambda: command_name, lambda: args[1:])
+        resp = await execute_command(self, *args, **options)
+        logger.opt(lazy=True).debug(
+            "Response from command {} with args {}: {!r}", lambda: command_name, lambda: args[1:], lambda: resp
+        )
+        return resp
+
+    return wrapper
@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from loguru import logger
+from redis.asyncio import client
+from redis.exceptions import ConnectionError, RedisError, ResponseError
+
+from felpsbot_redis import Redis
+
+
+class AutoPipelineTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.redis = Redis(auto_pipeline=True)
+        self.batches = []
+
+    def patch_execute(self, execute):
+        patcher = patch.object(client.Pipeline, "execute", execute)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_commands_in_the_same_iteration_share_a_pipeline(self):
+        async def execute(pipe, raise_on_error=True):
+            self.batches.append([args for args, _ in pipe.command_stack])
+            return [args[1] for args, _ in pipe.command_stack]
+
+        self.patch_execute(execute)
+
+        results = await asyncio.gather(self.redis.execute_command("GET", "a"), self.redis.json.get("b"))
+
+        self.assertEqual(results, ["a", "b"])
+        self.assertEqual(self.batches, [[("GET", "a"), ("JSON.GET", "b", ".")]])
+
+    async def test_errors_are_raised_only_to_their_caller(self):
+        error = ResponseError("WRONGTYPE")
+
+        async def execute(pipe, raise_on_error=True):
+            self.assertFalse(raise_on_error)
+            return [error if args[0] == "INCR" else args[1] for args, _ in pipe.command_stack]
+
+        self.patch_execute(execute)
+
+        results = await asyncio.gather(
+            self.redis.execute_command("GET", "a"),
+            self.redis.execute_command("INCR", "b"),
+            self.redis.execute_command("GET", "c"),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results, ["a", error, "c"])
+
+    async def test_connection_errors_are_raised_to_every_caller(self):
+        async def execute(pipe, raise_on_error=True):
+            raise ConnectionError("Connection refused")
+
+        self.patch_execute(execute)
+
+        results = await asyncio.gather(
+            self.redis.execute_command("GET", "a"),
+            self.redis.execute_command("GET", "b"),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(results[0], ConnectionError)
+        self.assertIs(results[0], results[1])
+
+    async def test_cancelled_caller_does_not_affect_the_batch(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def execute(pipe, raise_on_error=True):
+            started.set()
+            await release.wait()
+            return [args[1] for args, _ in pipe.command_stack]
+
+        self.patch_execute(execute)
+
+        cancelled = asyncio.create_task(self.redis.execute_command("GET", "a"))
+        remaining = asyncio.create_task(self.redis.execute_command("GET", "b"))
+        await started.wait()
+        cancelled.cancel()
+        release.set()
+
+        self.assertEqual(await remaining, "b")
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+        # The next iteration starts a new batch.
+        self.assertEqual(await self.redis.execute_command("GET", "c"), "c")
+
+    async def test_connection_state_commands_are_not_batched(self):
+        async def execute(pipe, raise_on_error=True):
+            self.batches.append([args for args, _ in pipe.command_stack])
+            return [args[1] for args, _ in pipe.command_stack]
+
+        async def execute_command(redis, *args, **options):
+            return "OK"
+
+        self.patch_execute(execute)
+        with patch.object(client.Redis, "execute_command", execute_command):
+            results = await asyncio.wait_for(
+                asyncio.gather(self.redis.execute_command("WATCH", "w"), self.redis.execute_command("GET", "a")), 1
+            )
+
+        self.assertEqual(results, ["OK", "a"])
+        self.assertEqual(self.batches, [[("GET", "a")]])
+
+    async def test_missing_results_fail_the_batch(self):
+        async def execute(pipe, raise_on_error=True):
+            return ["a"]
+
+        self.patch_execute(execute)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                self.redis.execute_command("GET", "a"),
+                self.redis.execute_command("GET", "b"),
+                return_exceptions=True,
+            ),
+            1,
+        )
+
+        self.assertIsInstance(results[0], RedisError)
+        self.assertIs(results[0], results[1])
+
+    async def test_batches_are_not_logged(self):
+        async def execute(pipe, raise_on_error=True):
+            return [args[1] for args, _ in pipe.command_stack]
+
+        self.patch_execute(execute)
+        messages = []
+        handler_id = logger.add(messages.append, level="DEBUG")
+        self.addCleanup(logger.remove, handler_id)
+
+        await asyncio.gather(self.redis.execute_command("GET", "a"), self.redis.execute_command("GET", "b"))
+
+        self.assertEqual(messages, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+
+from loguru import logger
+from redis.asyncio import connection
+
+import felpsbot_redis
+from felpsbot_redis import Redis
+
+
+class ConnectTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        felpsbot_redis._warn_if_hiredis_missing.cache_clear()
+        self.addCleanup(felpsbot_redis._warn_if_hiredis_missing.cache_clear)
+        self.warnings = []
+        handler_id = logger.add(self.warnings.append, level="WARNING")
+        self.addCleanup(logger.remove, handler_id)
+
+    async def connect_twice(self):
+        async def ping(redis):
+            return True
+
+        with patch.object(Redis, "ping", ping):
+            await Redis().connect()
+            await Redis().connect()
+
+    async def test_missing_hiredis_is_warned_once(self):
+        with patch.object(connection, "HIREDIS_AVAILABLE", False):
+            await self.connect_twice()
+
+        self.assertEqual(len(self.warnings), 1)
+        self.assertIn("hiredis is not installed", self.warnings[0])
+
+    async def test_no_warning_with_hiredis(self):
+        with patch.object(connection, "HIREDIS_AVAILABLE", True):
+            await self.connect_twice()
+
+        self.assertEqual(self.warnings, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
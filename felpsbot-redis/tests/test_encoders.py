@@ -0,0 +1,98 @@
+import json
+import unittest
+
+from felpsbot_redis import Redis
+from felpsbot_redis.async_json.encoders import OrjsonDecoder, OrjsonEncoder, orjson
+
+NAN = float("nan")
+INF = float("inf")
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class OrjsonEncoderTest(unittest.TestCase):
+    def setUp(self):
+        self.encoder = OrjsonEncoder()
+
+    def assertEncodesLikeStdlib(self, values):
+        # orjson's output is compact and not ASCII-escaped, so compare what it decodes to.
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(json.loads(self.encoder.encode(value)), json.loads(json.dumps(value)))
+
+    def test_json_types(self):
+        self.assertEncodesLikeStdlib(
+            [None, True, 0, -1.5, -0.0, 1e16, "", "café", "😀", [1, "a", None], (1, 2), {"a": {"b": [1.5]}}]
+        )
+
+    def test_non_str_keys(self):
+        self.assertEncodesLikeStdlib([{1: 2}, {True: 1, None: 2}, {1.5: 3}])
+
+    def test_ints_beyond_64_bits(self):
+        self.assertEncodesLikeStdlib([2**63, 2**64, -(2**63) - 1, [10**40], {"a": -(10**40)}])
+
+    def test_non_finite_floats_are_not_written_as_null(self):
+        for value in (NAN, INF, -INF, [1, NAN], {"a": [INF]}, {NAN: 1}):
+            with self.subTest(value=value):
+                self.assertEqual(self.encoder.encode(value), json.dumps(value))
+
+    def test_lone_surrogates(self):
+        self.assertEqual(self.encoder.encode("\ud800"), json.dumps("\ud800"))
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class OrjsonDecoderTest(unittest.TestCase):
+    def setUp(self):
+        self.decoder = OrjsonDecoder()
+
+    def assertDecodesLikeStdlib(self, documents):
+        for document in documents:
+            with self.subTest(document=document):
+                decoded = self.decoder.decode(document)
+                expected = json.loads(document)
+                self.assertEqual(repr(decoded), repr(expected))
+                self.assertEqual(type(decoded), type(expected))
+
+    def test_str_bytes_and_bytearray(self):
+        for document in ('{"a": [1, 1.5, "café", null, true]}', '"x"', "-0.0"):
+            self.assertDecodesLikeStdlib([document, document.encode(), bytearray(document.encode())])
+
+    def test_long_integers(self):
+        self.assertDecodesLikeStdlib(
+            [
+                "9223372036854775807",
+                "-9223372036854775808",
+                "-9223372036854775809",
+                b"12345678901234567890",
+                b'{"a": [123456789012345678901234567890]}',
+                '"1234567890123456789"',
+            ]
+        )
+
+    def test_non_finite_floats(self):
+        # `repr` makes NaN comparable with itself.
+        self.assertDecodesLikeStdlib(["NaN", b"[Infinity, -Infinity]", "1e400", b'{"a": -1e400}'])
+
+    def test_invalid_documents_raise_like_stdlib(self):
+        for document in (b"OK", "", "[1,", b"{'a': 1}"):
+            with self.subTest(document=document):
+                with self.assertRaises(json.JSONDecodeError):
+                    self.decoder.decode(document)
+
+    def test_invalid_utf8_raises_like_stdlib(self):
+        with self.assertRaises(UnicodeDecodeError):
+            self.decoder.decode(b'"\xff"')
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class JSONDecodeTest(unittest.TestCase):
+    def test_replies_are_decoded_like_with_the_stdlib(self):
+        stdlib = Redis().json
+        with_orjson = Redis(json_decoder=OrjsonDecoder()).json
+
+        for reply in (None, "null", b"null", "[1]", b'{"a": [1.5, null]}', b"12345678901234567890", b"NaN", "OK"):
+            with self.subTest(reply=reply):
+                self.assertEqual(repr(with_orjson._decode(reply)), repr(stdlib._decode(reply)))
+
+
+if __name__ == "__main__":
+    unittest.main()
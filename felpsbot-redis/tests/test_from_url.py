@@ -0,0 +1,36 @@
+import unittest
+
+from redis import asyncio as aioredis
+
+from felpsbot_redis import Redis
+
+
+class FromUrlTest(unittest.IsolatedAsyncioTestCase):
+    async def test_uses_a_regular_connection_pool_by_default(self):
+        redis = Redis.from_url("redis://localhost:6379/0", max_connections=8)
+
+        self.assertIs(type(redis.connection_pool), aioredis.ConnectionPool)
+        self.assertEqual(redis.connection_pool.max_connections, 8)
+        self.assertTrue(redis.connection_pool.connection_kwargs["socket_keepalive"])
+        self.assertTrue(redis.auto_close_connection_pool)
+
+    async def test_blocking_pool_is_opt_in(self):
+        redis = Redis.from_url("redis://localhost:6379/0", blocking_pool=True, timeout=1)
+
+        self.assertIsInstance(redis.connection_pool, aioredis.BlockingConnectionPool)
+        self.assertEqual(redis.connection_pool.timeout, 1)
+
+    async def test_client_arguments_are_not_passed_to_the_pool(self):
+        with self.assertWarns(DeprecationWarning):
+            redis = Redis.from_url(
+                "redis://localhost:6379/0", single_connection_client=True, auto_close_connection_pool=False
+            )
+
+        self.assertTrue(redis.single_connection_client)
+        self.assertFalse(redis.auto_close_connection_pool)
+        self.assertNotIn("single_connection_client", redis.connection_pool.connection_kwargs)
+        self.assertNotIn("auto_close_connection_pool", redis.connection_pool.connection_kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from felpsbot_redis import Redis
+from felpsbot_redis.async_json import commands
+from felpsbot_redis.async_json.commands import SET_WITH_TTL_SCRIPT
+from felpsbot_redis.pipeline import Pipeline
+
+SET_WITH_TTL_SHA = hashlib.sha1(SET_WITH_TTL_SCRIPT.encode()).hexdigest()
+
+
+class JSONCommandsTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.redis = Redis()
+        self.commands = []
+        self.pipelines = []
+        self.reply = "OK"
+        # Set before the json module is created, as it binds the client's `execute_command`.
+        self.redis.execute_command = self.execute_command
+        self.json = self.redis.json
+
+        async def execute_pipeline(pipe, raise_on_error=True):
+            self.pipelines.append([args for args, _ in pipe.command_stack])
+            return [self.reply for _ in pipe.command_stack]
+
+        patcher = patch.object(Pipeline, "execute", execute_pipeline)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def execute_command(self, *args, **options):
+        self.commands.append(args)
+        return self.reply
+
+
+class SetTest(JSONCommandsTestCase):
+    async def test_set_without_ttl(self):
+        await self.json.set("key", "$", {"a": 1}, nx=True)
+
+        self.assertEqual(self.commands, [("JSON.SET", "key", "$", '{"a": 1}', "NX")])
+
+    async def test_set_with_ttl_runs_the_script(self):
+        await self.json.set("key", "$", {"a": 1}, xx=True, ttl=10)
+
+        self.assertEqual(self.commands, [("EVALSHA", SET_WITH_TTL_SHA, 1, "key", 10, "$", '{"a": 1}', "XX")])
+
+    async def test_set_with_ttl_returns_like_json_set(self):
+        for reply, expected in ((b"OK", True), ("OK", True), (None, None)):
+            with self.subTest(reply=reply):
+                self.reply = reply
+                self.assertIs(await self.json.set("key", "$", 1, nx=True, ttl=10), expected)
+
+    async def test_set_with_ttl_in_a_pipeline_is_queued(self):
+        pipe = self.json.pipeline()
+        await pipe.set("key", "$", 1, ttl=10)
+
+        self.assertEqual(
+            [args for args, _ in pipe.command_stack], [("EVALSHA", SET_WITH_TTL_SHA, 1, "key", 10, "$", "1")]
+        )
+        self.assertEqual(self.commands, [])
+
+
+class SetPathTest(JSONCommandsTestCase):
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        patcher = patch.object(commands, "_SET_PATH_CHUNK_SIZE", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, name, content):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write(content)
+        return path
+
+    async def test_set_path_sends_mset_in_chunks(self):
+        paths = [self.write(f"{name}.json", f'{{"{name}": 1}}') for name in "abc"]
+
+        result = await self.json.set_path("$", self.root)
+
+        self.assertEqual(result, dict.fromkeys(paths, True))
+        self.assertEqual([len(command) for command in self.commands], [7, 4])
+        self.assertTrue(all(command[0] == "JSON.MSET" for command in self.commands))
+        triplets = sorted(piece for command in self.commands for piece in zip(*[iter(command[1:])] * 3))
+        self.assertEqual(
+            triplets, [(path[: -len(".json")], "$", f'{{"{name}": 1}}') for path, name in zip(paths, "abc")]
+        )
+
+    async def test_set_path_reports_invalid_files(self):
+        good = self.write("good.json", "[1]")
+        bad = self.write("nested/bad.json", "not json")
+
+        result = await self.json.set_path("$", self.root)
+
+        self.assertEqual(result, {good: True, bad: False})
+        self.assertEqual(self.commands, [("JSON.MSET", good[: -len(".json")], "$", "[1]")])
+
+    async def test_set_path_skips_chunks_without_valid_files(self):
+        self.write("bad.json", "not json")
+
+        self.assertEqual(await self.json.set_path("$", self.root), {os.path.join(self.root, "bad.json"): False})
+        self.assertEqual(self.commands, [])
+
+    async def test_set_path_with_nx_or_xx_uses_a_pipeline_per_chunk(self):
+        paths = [self.write(f"{name}.json", "1") for name in "abc"]
+
+        for option, flag in (("nx", "NX"), ("xx", "XX")):
+            with self.subTest(option=option):
+                self.pipelines.clear()
+                result = await self.json.set_path("$", self.root, **{option: True})
+
+                self.assertEqual(result, dict.fromkeys(paths, True))
+                self.assertEqual(self.commands, [])
+                self.assertEqual([len(pipeline) for pipeline in self.pipelines], [2, 1])
+                self.assertEqual(
+                    sorted(command for pipeline in self.pipelines for command in pipeline),
+                    [("JSON.SET", path[: -len(".json")], "$", "1", flag) for path in paths],
+                )
+
+
+class IterFilesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+
+    def path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def touch(self, *parts):
+        os.makedirs(self.path(*parts[:-1]), exist_ok=True)
+        open(self.path(*parts), "w").close()
+
+    def test_yields_files_recursively(self):
+        self.touch("a.json")
+        self.touch("sub", "b.json")
+        self.touch("sub", "deeper", "c.json")
+
+        self.assertEqual(
+            sorted(commands._iter_files(self.root)),
+            [self.path("a.json"), self.path("sub", "b.json"), self.path("sub", "deeper", "c.json")],
+        )
+
+    def test_follows_file_symlinks_but_not_folder_symlinks(self):
+        self.touch("real", "a.json")
+        os.symlink(self.path("real", "a.json"), self.path("link.json"))
+        os.symlink(self.path("real"), self.path("linked_folder"))
+
+        self.assertEqual(
+            sorted(commands._iter_files(self.root)), [self.path("link.json"), self.path("real", "a.json")]
+        )
+
+    def test_missing_root_yields_nothing(self):
+        self.assertEqual(list(commands._iter_files(self.path("missing"))), [])
+
+    def test_skips_unreadable_folders(self):
+        self.touch("a.json")
+        self.touch("private", "b.json")
+        scandir = os.scandir
+
+        def fake_scandir(path):
+            if path == self.path("private"):
+                raise PermissionError(path)
+            return scandir(path)
+
+        with patch.object(commands.os, "scandir", fake_scandir):
+            self.assertEqual(list(commands._iter_files(self.root)), [self.path("a.json")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from json import JSONEncoder
+
+from felpsbot_redis import Redis
+
+
+class ScalarEncodeTest(unittest.TestCase):
+    def setUp(self):
+        self.json = Redis().json
+        self.encoder = JSONEncoder()
+
+    def assertEncodesLikeStdlib(self, values):
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(self.json._encode(value), self.encoder.encode(value))
+
+    def test_str(self):
+        self.assertEncodesLikeStdlib(["", "channel_name", 'quote " and \\ slash', "café", "\n\t\x00", "\ud800", "😀"])
+
+    def test_bool_and_none(self):
+        self.assertEncodesLikeStdlib([True, False, None])
+
+    def test_int(self):
+        self.assertEncodesLikeStdlib([0, -1, 42, 2**63, -(2**64), 10**40])
+
+    def test_float(self):
+        self.assertEncodesLikeStdlib(
+            [0.0, -0.0, 1.5, 1e16, 1e-7, 1.7976931348623157e308, float("nan"), float("inf"), float("-inf")]
+        )
+
+    def test_containers_use_the_encoder(self):
+        self.assertEncodesLikeStdlib([[1, "a", None], {"a": 1.5, "b": [True]}, {1: 2}])
+
+    def test_custom_encoders_are_not_bypassed(self):
+        json = Redis(json_encoder=JSONEncoder(ensure_ascii=False)).json
+
+        self.assertEqual(json._encode("café"), '"café"')
+
+
+if __name__ == "__main__":
+    unittest.main()